@@ -37,7 +37,7 @@ def initAdArrays(variables: list[np.ndarray]) -> list[AdArray]:
         n = num_values_per_variable[i]
         jac = [sps.csc_matrix((n, m)) for m in num_values_per_variable]
         # Set jacobian of variable i to I
-        jac[i] = sps.diags(np.ones(num_values_per_variable[i])).tocsr()
+        jac[i] = sps.identity(n, format="csr")
         # initiate AdArray
         jac = sps.bmat([jac])
         ad_arrays.append(AdArray(val, jac))
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import copy
 from enum import Enum
-from functools import reduce
 from itertools import count
 from typing import Any, Literal, Optional, Sequence, Union, overload
 
@@ -1986,7 +1985,16 @@ def sum_operator_list(
         Operator that is the sum of the input operators.
 
     """
-    result = reduce(lambda a, b: a + b, operators)
+    # Add the operators pairwise, so that the depth of the resulting operator tree
+    # grows logarithmically, not linearly, with the number of operators. This limits
+    # the recursion depth when the tree is parsed.
+    terms = list(operators)
+    while len(terms) > 1:
+        pairs = [a + b for a, b in zip(terms[::2], terms[1::2])]
+        if len(terms) % 2 == 1:
+            pairs.append(terms[-1])
+        terms = pairs
+    result = terms[0]
 
     if name is not None:
         result.set_name(name)
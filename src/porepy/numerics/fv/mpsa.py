@@ -1873,7 +1873,7 @@ class Mpsa(Discretization):
             Rearranged matrix.
 
         """
-        P = sps.diags(np.ones(shape[axis])).tocsr()
+        P = sps.identity(shape[axis], format="csr")
         num_var = shape[axis] / nd
         mapping = np.argsort(np.tile(np.arange(num_var), nd), kind="mergesort")
         if axis == 1:
@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 
 import porepy as pp
@@ -54,13 +56,15 @@ class Graph:
         """
         Breadth first search
         """
-        visited, queue = [], [start]
+        # Use a deque for the FIFO queue and a set for the visited nodes, so that
+        # both popping and membership checks are O(1).
+        visited, queue = set(), deque([start])
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             if node not in visited:
-                visited.append(node)
+                visited.add(node)
                 neighbors = pp.matrix_operations.slice_indices(
                     self.node_connections, node
                 )
                 queue.extend(neighbors)
-        self.color[visited] = color
+        self.color[list(visited)] = color